@@ -4,16 +4,158 @@ MCP to OpenAPI Bridge
 Translates OpenAPI calls from Open WebUI to MCP protocol calls to k8s-mcp-server
 """
 
+import atexit
+import concurrent.futures
+import hashlib
+import heapq
 import json
 import logging
+import logging.handlers
+import mmap
+import queue
+import random
+import re
+import shutil
+import signal
+import sqlite3
 import requests
 import sseclient
 import yaml
 import os
-from flask import Flask, request, jsonify
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import Counter
+from flask import Flask, Response, request, jsonify
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging configuration
+LOG_LEVEL = os.environ.get("BRIDGE_LOG_LEVEL", "INFO").upper()
+LOG_MAX_PAYLOAD = int(os.environ.get("BRIDGE_LOG_MAX_PAYLOAD", "1024"))
+LOG_SAMPLE_RATE = float(os.environ.get("BRIDGE_LOG_SAMPLE_RATE", "0.1"))
+LOG_SLOW_SECONDS = float(os.environ.get("BRIDGE_LOG_SLOW_SECONDS", "5"))
+
+# Keys whose values are never logged (helm values, manifest fields, --set args)
+SECRET_KEY_PATTERN = re.compile(r"pass(word|wd)?|secret|token|credential|api[-_]?key|private[-_]?key|auth", re.I)
+
+
+LOG_QUEUE = queue.SimpleQueue()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with structured fields passed via extra={"fields": ...}"""
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging():
+    """Route all records through a queue so request threads never block on I/O"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    listener = logging.handlers.QueueListener(LOG_QUEUE, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(LOG_QUEUE)]
+    root.setLevel(LOG_LEVEL)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def redact(value):
+    """Mask values under secret-looking keys in nested dicts and lists"""
+    if isinstance(value, dict):
+        # Nested objects keep their structure; anything else under a matching key, lists included, is masked
+        return {
+            k: "***" if SECRET_KEY_PATTERN.search(str(k)) and not isinstance(v, dict) else redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def redact_manifest(manifest):
+    """Mask Secret data and secret-looking fields in a YAML manifest string"""
+    try:
+        documents = [doc for doc in yaml.safe_load_all(manifest) if doc is not None]
+    except yaml.YAMLError:
+        return f"<unparseable manifest, {len(manifest)} chars>"
+    for doc in documents:
+        _mask_secret_data(doc)
+    return redact(documents)
+
+
+def _mask_secret_data(doc):
+    """Mask data of Secret objects, including those inside List kinds"""
+    if not isinstance(doc, dict):
+        return
+    if doc.get("kind") == "Secret":
+        for field in ("data", "stringData"):
+            if isinstance(doc.get(field), dict):
+                doc[field] = {k: "***" for k in doc[field]}
+            elif field in doc:
+                doc[field] = "***"
+    elif isinstance(doc.get("items"), list):
+        for item in doc["items"]:
+            _mask_secret_data(item)
+
+
+def redact_args(cmd):
+    """Mask --set values for secret-looking keys in a command line"""
+    return [
+        arg.split("=", 1)[0] + "=***" if "=" in arg and SECRET_KEY_PATTERN.search(arg.split("=", 1)[0]) else arg
+        for arg in cmd
+    ]
+
+
+def truncate(text, limit=None):
+    limit = LOG_MAX_PAYLOAD if limit is None else limit
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...(+{len(text) - limit} chars)"
+
+
+def log_tool_call(tool_name, arguments, result, elapsed):
+    """Log a tool call: errors and slow calls always, successes sampled"""
+    failed = isinstance(result, dict) and "error" in result
+    slow = elapsed >= LOG_SLOW_SECONDS
+    if not failed and not slow and random.random() >= LOG_SAMPLE_RATE:
+        return
+
+    # Rejected bodies may be any JSON value, so only objects are copied and inspected
+    arguments = dict(arguments) if isinstance(arguments, dict) else arguments
+    if isinstance(arguments, dict) and isinstance(arguments.get("manifest"), str):
+        arguments["manifest"] = redact_manifest(arguments["manifest"])
+    fields = {
+        "tool": tool_name,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "args": truncate(json.dumps(redact(arguments), default=str)),
+    }
+    if failed:
+        fields["error"] = truncate(str(result["error"]))
+        logger.warning("tool call failed", extra={"fields": fields})
+    elif slow:
+        logger.warning("slow tool call", extra={"fields": fields})
+    else:
+        fields["sampled"] = LOG_SAMPLE_RATE
+        logger.info("tool call", extra={"fields": fields})
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
@@ -21,59 +163,255 @@ app = Flask(__name__)
 # MCP Server configuration
 MCP_SERVER_URL = "http://k8s-mcp-server-backend:8080"
 
-def fix_kubeconfig():
-    """Fix kubeconfig to use the correct API server endpoint"""
+# Object/event cache configuration (seconds)
+CACHE_TTL = float(os.environ.get("BRIDGE_CACHE_TTL", "5"))
+# Lists read within this window are kept fresh in the background (seconds)
+CACHE_KEEP_WARM = float(os.environ.get("BRIDGE_CACHE_KEEP_WARM", "300"))
+# How often a kept-warm list is refetched, across all replicas sharing the backend (seconds)
+CACHE_REFRESH_INTERVAL = float(os.environ.get("BRIDGE_CACHE_REFRESH_INTERVAL", "30"))
+# "memory", or "sqlite:///path/cache.db" on a volume shared by replicas
+CACHE_BACKEND = os.environ.get("BRIDGE_CACHE_BACKEND", "memory")
+
+# Result spill configuration: outputs above the inline limit are kept on disk
+RESULT_DIR = os.environ.get("BRIDGE_RESULT_DIR", os.path.join(tempfile.gettempdir(), "mcp-bridge-results"))
+RESULT_TTL = float(os.environ.get("BRIDGE_RESULT_TTL", "600"))
+RESULT_INLINE_BYTES = int(os.environ.get("BRIDGE_RESULT_INLINE_BYTES", str(512 * 1024)))
+RESULT_PREVIEW_BYTES = 4 * 1024
+RESULT_FETCH_BYTES = 64 * 1024
+RESULT_FETCH_MAX_BYTES = 1024 * 1024
+RESULT_STDERR_BYTES = 16 * 1024
+
+# Readiness: background check interval and per-call timeout (seconds)
+READY_CHECK_INTERVAL = float(os.environ.get("BRIDGE_READY_CHECK_INTERVAL", "30"))
+READY_CHECK_TIMEOUT = int(os.environ.get("BRIDGE_READY_CHECK_TIMEOUT", "5"))
+# Concurrent tool calls / queued log records at which the bridge reports not ready
+MAX_INFLIGHT = int(os.environ.get("BRIDGE_MAX_INFLIGHT", "32"))
+LOG_QUEUE_SATURATED = 10000
+
+KUBECONFIG_PATH = os.environ.get("KUBECONFIG", "/root/.kube/config")
+# Copy with rewritten server URLs; the mounted kubeconfig is read-only
+RUNTIME_KUBECONFIG = os.path.join(tempfile.gettempdir(), "mcp-bridge-kubeconfig")
+KIND_SERVER = "https://kind-mcp-lab-control-plane:6443"
+
+# Startup warm-up: parallel workers, overall timeout (seconds), cache lists to pre-load
+WARM_WORKERS = int(os.environ.get("BRIDGE_WARM_WORKERS", "4"))
+WARM_TIMEOUT = float(os.environ.get("BRIDGE_WARM_TIMEOUT", "60"))
+WARM_HELM_REPOS = os.environ.get("BRIDGE_WARM_HELM_REPOS", "true").lower() == "true"
+# Comma-separated resource[:namespace] specs; "*" is all namespaces
+WARM_RESOURCES = os.environ.get("BRIDGE_WARM_RESOURCES", "pods:*,deployments:*,nodes,events:*")
+
+# Optional directory persisted across restarts: kubectl discovery cache and cache snapshot
+BRIDGE_STATE_DIR = os.environ.get("BRIDGE_STATE_DIR")
+SNAPSHOT_PATH = os.path.join(BRIDGE_STATE_DIR, "cache-snapshot.json") if BRIDGE_STATE_DIR else None
+SNAPSHOT_MAX_AGE = float(os.environ.get("BRIDGE_SNAPSHOT_MAX_AGE", "300"))
+# kubectl cannot write its discovery cache under the read-only ~/.kube mount
+os.environ.setdefault("KUBECACHEDIR", os.path.join(
+    BRIDGE_STATE_DIR or tempfile.gettempdir(), "kube-cache"))
+
+# kubectl verbs that change cluster state
+MUTATING_KUBECTL_VERBS = {"apply", "create", "delete", "scale", "patch", "edit", "label", "annotate", "rollout"}
+
+# In-memory kubeconfig, loaded by startup()
+KUBECONFIG = {}
+
+
+def load_kubeconfig():
+    """Load kubeconfig into memory and point kind clusters at the control-plane container.
+
+    The mounted file is never rewritten; when a server URL has to change,
+    kubectl and helm are pointed at a private runtime copy instead.
+    """
+    global KUBECONFIG
     try:
-        kubeconfig_path = "/root/.kube/config"
-        if os.path.exists(kubeconfig_path):
-            with open(kubeconfig_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            # Update the server URL to use the kind container directly
-            for cluster in config.get('clusters', []):
-                if 'kind-mcp-lab-control-plane' in cluster['cluster']['server']:
-                    # Change to use the kind container directly on port 6443
-                    cluster['cluster']['server'] = 'https://kind-mcp-lab-control-plane:6443'
-                    logger.info(f"Updated cluster server to: {cluster['cluster']['server']}")
-            
-            # Write back the modified config
-            with open(kubeconfig_path, 'w') as f:
-                yaml.dump(config, f)
-                
-            logger.info("Kubeconfig updated successfully")
-    except Exception as e:
-        logger.error(f"Failed to fix kubeconfig: {e}")
+        with open(KUBECONFIG_PATH, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.error(f"Failed to load kubeconfig: {e}")
+        return
+
+    # Update the server URL to use the kind container directly
+    changed = False
+    for cluster in config.get('clusters', []):
+        server = cluster.get('cluster', {}).get('server', '')
+        if 'kind-mcp-lab-control-plane' in server and server != KIND_SERVER:
+            cluster['cluster']['server'] = KIND_SERVER
+            changed = True
+            logger.info(f"Updated cluster server to: {KIND_SERVER}")
+
+    if changed:
+        fd = os.open(RUNTIME_KUBECONFIG, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            yaml.safe_dump(config, f)
+        os.environ["KUBECONFIG"] = RUNTIME_KUBECONFIG
+
+    KUBECONFIG = config
+    logger.info(f"Kubeconfig loaded with {len(config.get('contexts', []))} contexts")
+
+
+# Spill-to-disk result store
+class ResultStore:
+    """Oversized command outputs kept on disk and served by cursor via mmap.
+
+    Handles live in the cache backend and name a file in the result
+    directory, so replicas sharing both can serve each other's results.
+    """
+
+    def __init__(self, directory, ttl, backend):
+        self.directory = directory
+        self.ttl = ttl
+        self.backend = backend
+        os.makedirs(directory, exist_ok=True)
+        # Files left by a previous process are swept once their TTL has passed
+        self.expire()
+
+    def spool(self):
+        """Open a new spill file for a command's stdout"""
+        return tempfile.NamedTemporaryFile(dir=self.directory, prefix="result-", delete=False)
+
+    def register(self, path, size):
+        """Keep a spill file and return a handle with a short preview"""
+        result_id = uuid.uuid4().hex
+        self.backend.set(f"result:{result_id}", {"file": os.path.basename(path), "size": size}, self.ttl)
+        preview = self.fetch(result_id, 0, RESULT_PREVIEW_BYTES)
+        return {
+            "resultId": result_id,
+            "size": size,
+            "truncated": True,
+            "preview": preview["data"],
+            "cursor": preview["cursor"],
+            "message": "Output too large to return inline; use /fetch_result with resultId and cursor to read the rest",
+        }
+
+    def fetch(self, result_id, cursor=0, limit=RESULT_FETCH_BYTES, lines=None):
+        """Read from cursor up to limit bytes, or a number of lines"""
+        entry = self.backend.get(f"result:{result_id}")
+        if entry is None:
+            return {"error": f"Result {result_id} not found or expired"}
+        path, size = os.path.join(self.directory, entry[1]["file"]), entry[1]["size"]
+        cursor = max(0, min(int(cursor), size))
+        limit = max(1, min(int(limit), RESULT_FETCH_MAX_BYTES))
+
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            # Swept by this or another replica as its handle ran out
+            return {"error": f"Result {result_id} not found or expired"}
+        with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = min(cursor + limit, size)
+            if lines is not None:
+                # Advance one line at a time, still capped at limit bytes
+                pos = cursor
+                for _ in range(max(0, int(lines))):
+                    newline = mm.find(b"\n", pos, end)
+                    if newline == -1:
+                        pos = end
+                        break
+                    pos = newline + 1
+                end = pos
+            elif end < size:
+                # Keep chunks line-aligned when the range holds a full line
+                newline = mm.rfind(b"\n", cursor, end)
+                if newline != -1:
+                    end = newline + 1
+            data = mm[cursor:end]
+
+        return {
+            "resultId": result_id,
+            "data": data.decode("utf-8", errors="replace"),
+            "cursor": end,
+            "size": size,
+            "eof": end >= size,
+        }
+
+    def start_sweeper(self):
+        """Expire spill files on a timer, even when no requests arrive"""
+        def sweep():
+            while True:
+                time.sleep(min(self.ttl, 60))
+                self.expire()
+        threading.Thread(target=sweep, name="result-sweeper", daemon=True).start()
+
+    def expire(self):
+        """Delete spill files last written more than a TTL ago"""
+        cutoff = time.time() - self.ttl
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            try:
+                if filename.startswith("result-") and os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except OSError:
+                # Already removed by another replica
+                pass
+
 
-# Fix kubeconfig on startup
-fix_kubeconfig()
+def run_spooled(cmd, input_data=None, timeout=60):
+    """Run a command with stdout streamed straight to a spill file.
 
-def execute_kubectl_command(args, input_data=None):
+    Returns (returncode, stdout_path, stdout_size, stderr_text).
+    """
+    with result_store.spool() as out, tempfile.TemporaryFile() as err:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+                stdout=out,
+                stderr=err
+            )
+            try:
+                proc.communicate(input_data.encode() if input_data is not None else None, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+        except Exception:
+            # The spill file is created with delete=False
+            os.remove(out.name)
+            raise
+
+        size = os.fstat(out.fileno()).st_size
+        # Only the tail of stderr is useful in an error message
+        err_size = os.fstat(err.fileno()).st_size
+        err.seek(max(0, err_size - RESULT_STDERR_BYTES))
+        stderr = err.read().decode("utf-8", errors="replace")
+    return proc.returncode, out.name, size, stderr
+
+
+def read_spooled(path, size, spill=True):
+    """Return small outputs as text, or a result handle for oversized ones"""
+    if spill and size > RESULT_INLINE_BYTES:
+        return None, result_store.register(path, size)
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace"), None
+    finally:
+        os.remove(path)
+
+def execute_kubectl_command(args, input_data=None, spill=True):
     """Execute kubectl command directly"""
-    import subprocess
-    import json
-    
     try:
         # Build the full kubectl command
         cmd = ["kubectl"] + args
-        logger.info(f"Executing kubectl command: {' '.join(cmd)}")
+        logger.debug(f"Executing kubectl command: {' '.join(redact_args(cmd))}")
         
-        # Execute the command
-        result = subprocess.run(
-            cmd,
-            input=input_data,
-            text=True,
-            capture_output=True,
-            timeout=60
-        )
+        # Execute the command, streaming stdout to disk
+        returncode, stdout_path, size, stderr = run_spooled(cmd, input_data, timeout=60)
         
-        if result.returncode == 0:
+        # Mutations make cached lists stale
+        if args and args[0] in MUTATING_KUBECTL_VERBS:
+            resource_cache.invalidate()
+
+        if returncode == 0:
+            stdout, handle = read_spooled(stdout_path, size, spill)
+            if handle:
+                return handle
             # Try to parse as JSON if possible
             try:
-                return json.loads(result.stdout)
+                return json.loads(stdout)
             except json.JSONDecodeError:
-                return {"output": result.stdout.strip()}
+                return {"output": stdout.strip()}
         else:
-            return {"error": f"kubectl command failed: {result.stderr.strip()}"}
+            os.remove(stdout_path)
+            return {"error": f"kubectl command failed: {stderr.strip()}"}
             
     except subprocess.TimeoutExpired:
         return {"error": "kubectl command timed out"}
@@ -83,36 +421,35 @@ def execute_kubectl_command(args, input_data=None):
 
 def execute_helm_command(args, input_data=None):
     """Execute helm command directly"""
-    import subprocess
-    import json
-    
     try:
         # Build the full helm command
         cmd = args  # args already includes 'helm' as first element
-        logger.info(f"Executing helm command: {' '.join(cmd)}")
-        logger.info(f"Full command args: {args}")
+        logger.debug(f"Executing helm command: {' '.join(redact_args(cmd))}")
         
-        # Execute the command
-        result = subprocess.run(
+        # Execute the command, streaming stdout to disk
+        returncode, stdout_path, size, stderr = run_spooled(
             cmd,
-            input=input_data,
-            text=True,
-            capture_output=True,
+            input_data,
             timeout=120  # Helm operations can take longer
         )
         
-        logger.info(f"Helm command stdout: {result.stdout}")
-        logger.info(f"Helm command stderr: {result.stderr}")
-        logger.info(f"Helm command return code: {result.returncode}")
+        logger.debug(f"Helm command return code: {returncode}, stdout: {size} bytes")
+        
+        # Releases create, change and remove cluster objects
+        resource_cache.invalidate()
         
-        if result.returncode == 0:
+        if returncode == 0:
+            stdout, handle = read_spooled(stdout_path, size)
+            if handle:
+                return handle
             # Try to parse as JSON if possible
             try:
-                return json.loads(result.stdout)
+                return json.loads(stdout)
             except json.JSONDecodeError:
-                return {"output": result.stdout.strip()}
+                return {"output": stdout.strip()}
         else:
-            return {"error": f"helm command failed: {result.stderr.strip()}"}
+            os.remove(stdout_path)
+            return {"error": f"helm command failed: {stderr.strip()}"}
             
     except subprocess.TimeoutExpired:
         return {"error": "helm command timed out"}
@@ -120,724 +457,1651 @@ def execute_helm_command(args, input_data=None):
         logger.error(f"Error executing helm command: {e}")
         return {"error": str(e)}
 
-def call_mcp_tool_via_sse(tool_name, arguments):
-    """Call kubectl directly instead of via MCP for now"""
-    try:
-        logger.info(f"Calling tool {tool_name} with args: {arguments}")
-        
-        if tool_name == "kubectl_get":
-            # Build kubectl get command
-            args = ["get", arguments.get("resourceType", "pods")]
-            
-            # Add name if specified
-            if arguments.get("name"):
-                args.append(arguments["name"])
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            # Add output format
-            output_format = arguments.get("output", "json")
-            if output_format == "json":
-                args.extend(["-o", "json"])
-            elif output_format == "yaml":
-                args.extend(["-o", "yaml"])
-            elif output_format == "wide":
-                args.extend(["-o", "wide"])
-            
-            # Add selectors
-            if arguments.get("labelSelector"):
-                args.extend(["-l", arguments["labelSelector"]])
-            if arguments.get("fieldSelector"):
-                args.extend(["--field-selector", arguments["fieldSelector"]])
-            
-            # Add all namespaces flag
-            if arguments.get("allNamespaces"):
-                args.append("--all-namespaces")
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "kubectl_describe":
-            # Build kubectl describe command
-            args = ["describe", arguments.get("resourceType", "pod"), arguments.get("name", "")]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "kubectl_logs":
-            # Build kubectl logs command
-            args = ["logs"]
-            
-            if arguments.get("resourceType") == "deployment":
-                args.append(f"deployment/{arguments.get('name', '')}")
-            else:
-                args.append(arguments.get("name", ""))
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            # Add container if specified
-            if arguments.get("container"):
-                args.extend(["-c", arguments["container"]])
-            
-            # Add tail if specified
-            if arguments.get("tail"):
-                args.extend(["--tail", str(arguments["tail"])])
-            
-            # Add follow if specified
-            if arguments.get("follow"):
-                args.append("-f")
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "kubectl_apply":
-            # Build kubectl apply command
-            args = ["apply", "-f", "-"]  # Read from stdin
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            # Add dry-run if specified
-            if arguments.get("dryRun"):
-                args.append("--dry-run=client")
-            
-            # Handle manifest content
-            manifest = arguments.get("manifest")
-            if manifest:
-                return execute_kubectl_command(args, input_data=manifest)
-            else:
-                return {"error": "No manifest provided"}
-                
-        elif tool_name == "kubectl_delete":
-            # Build kubectl delete command
-            args = ["delete", arguments.get("resourceType", "pod"), arguments.get("name", "")]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            # Add force if specified
-            if arguments.get("force"):
-                args.append("--force")
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "kubectl_scale":
-            # Build kubectl scale command
-            resource_type = arguments.get("resourceType", "deployment")
-            name = arguments.get("name", "")
-            replicas = arguments.get("replicas", 1)
-            
-            args = ["scale", f"{resource_type}/{name}", f"--replicas={replicas}"]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "install_helm_chart":
-            # Build helm install command
-            args = ["helm", "install", arguments.get("name", "")]
-            
-            # Add chart
-            chart = arguments.get("chart", "")
-            if arguments.get("repo"):
-                # Add repo if specified
-                args.extend(["--repo", arguments["repo"]])
-            args.append(chart)
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["--namespace", namespace, "--create-namespace"])
-            
-            # Add values if specified
-            values = arguments.get("values")
-            if values:
-                # Convert nested dict to --set format
-                def dict_to_set_args(d, prefix=""):
-                    set_args = []
-                    for key, value in d.items():
-                        full_key = f"{prefix}.{key}" if prefix else key
-                        if isinstance(value, dict):
-                            set_args.extend(dict_to_set_args(value, full_key))
-                        else:
-                            set_args.extend(["--set", f"{full_key}={value}"])
-                    return set_args
-                
-                args.extend(dict_to_set_args(values))
-            
-            return execute_helm_command(args)
-            
-        elif tool_name == "upgrade_helm_chart":
-            # Build helm upgrade command
-            args = ["helm", "upgrade", arguments.get("name", "")]
-            
-            # Add chart
-            chart = arguments.get("chart", "")
-            if arguments.get("repo"):
-                # Add repo if specified
-                args.extend(["--repo", arguments["repo"]])
-            args.append(chart)
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["--namespace", namespace])
-            
-            # Add values if specified
-            values = arguments.get("values")
-            if values:
-                # Convert nested dict to --set format
-                def dict_to_set_args(d, prefix=""):
-                    set_args = []
-                    for key, value in d.items():
-                        full_key = f"{prefix}.{key}" if prefix else key
-                        if isinstance(value, dict):
-                            set_args.extend(dict_to_set_args(value, full_key))
-                        else:
-                            set_args.extend(["--set", f"{full_key}={value}"])
-                    return set_args
-                
-                args.extend(dict_to_set_args(values))
-            
-            return execute_helm_command(args)
-            
-        elif tool_name == "uninstall_helm_chart":
-            # Build helm uninstall command
-            args = ["helm", "uninstall", arguments.get("name", "")]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["--namespace", namespace])
-            
-            return execute_helm_command(args)
-            
-        elif tool_name == "exec_in_pod":
-            # Build kubectl exec command
-            args = ["exec", "-it", arguments.get("name", "")]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            # Add container if specified
-            if arguments.get("container"):
-                args.extend(["-c", arguments["container"]])
-            
-            # Add command
-            command = arguments.get("command", "")
-            if command:
-                args.extend(["--", "sh", "-c", command])
-            
-            return execute_kubectl_command(args)
-            
-        elif tool_name == "port_forward":
-            # Build kubectl port-forward command
-            resource_type = arguments.get("resourceType", "pod")
-            resource_name = arguments.get("resourceName", "")
-            local_port = arguments.get("localPort", 8080)
-            target_port = arguments.get("targetPort", 80)
-            
-            args = ["port-forward", f"{resource_type}/{resource_name}", f"{local_port}:{target_port}"]
-            
-            # Add namespace
-            namespace = arguments.get("namespace", "default")
-            if namespace != "default":
-                args.extend(["-n", namespace])
-            
-            return execute_kubectl_command(args)
-        
+# Cache backends
+class CacheBackend(ABC):
+    """Storage for cached values shared by the bridge's caches.
+
+    Every set() returns a new version; readers use it to tell whether
+    anything derived from a value is still current.
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """Return (version, value), or None when missing or expired"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """Store a JSON-serializable value and return its version"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, prefix=""):
+        """Drop every entry whose key starts with prefix"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def dump(self, prefix=""):
+        """Return {key: value} for unexpired entries whose key starts with prefix"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def acquire_lease(self, name, ttl):
+        """Return True if this caller now holds the named lease for ttl seconds"""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process backend"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._leases = {}
+        self._version = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[2] < time.time():
+            return None
+        return entry[0], entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._version += 1
+            self._entries[key] = (self._version, value, time.time() + ttl)
+            return self._version
+
+    def invalidate(self, prefix=""):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def dump(self, prefix=""):
+        now = time.time()
+        with self._lock:
+            return {k: e[1] for k, e in self._entries.items() if k.startswith(prefix) and e[2] >= now}
+
+    def acquire_lease(self, name, ttl):
+        now = time.time()
+        with self._lock:
+            if self._leases.get(name, 0) > now:
+                return False
+            self._leases[name] = now + ttl
+            return True
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Backend in a SQLite file on a volume shared by bridge replicas.
+
+    Values are stored as JSON. Versions come from an AUTOINCREMENT table
+    and are never reused, so a replica compares the shared version with
+    its decoded local copy and only reads the payload when it changed.
+    Deleting rows is the invalidation broadcast: every replica sees the
+    row missing on its next get.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._decoded = {}
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS versions (id INTEGER PRIMARY KEY AUTOINCREMENT)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, version INTEGER NOT NULL, expires REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, expires REAL NOT NULL)")
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _like_prefix(prefix):
+        """LIKE pattern matching keys that start with prefix"""
+        return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute("SELECT version, expires FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        version = row[0]
+
+        with self._lock:
+            decoded = self._decoded.get(key)
+        if decoded and decoded[0] == version:
+            return decoded
+
+        row = conn.execute("SELECT value FROM entries WHERE key = ? AND version = ?", (key, version)).fetchone()
+        if row is None:
+            return None
+        decoded = (version, json.loads(row[0]))
+        with self._lock:
+            self._decoded[key] = decoded
+        return decoded
+
+    def set(self, key, value, ttl):
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._connection() as conn:
+            version = conn.execute("INSERT INTO versions DEFAULT VALUES").lastrowid
+            conn.execute("DELETE FROM versions WHERE id < ?", (version,))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, version, expires, value) VALUES (?, ?, ?, ?)",
+                (key, version, time.time() + ttl, payload)
+            )
+        with self._lock:
+            self._decoded[key] = (version, value)
+        return version
+
+    def invalidate(self, prefix=""):
+        pattern = self._like_prefix(prefix)
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE key LIKE ? ESCAPE '\\'", (pattern,))
+        with self._lock:
+            for key in [k for k in self._decoded if k.startswith(prefix)]:
+                del self._decoded[key]
+
+    def dump(self, prefix=""):
+        pattern = self._like_prefix(prefix)
+        rows = self._connection().execute(
+            "SELECT key, value FROM entries WHERE key LIKE ? ESCAPE '\\' AND expires >= ?",
+            (pattern, time.time())
+        ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def acquire_lease(self, name, ttl):
+        # The upsert only changes a row when the lease is free or has lapsed
+        now = time.time()
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO leases (name, expires) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET expires = excluded.expires WHERE leases.expires < ?",
+                (name, now + ttl, now)
+            )
+        return cursor.rowcount == 1
+
+
+def make_cache_backend(spec):
+    """Build a backend from BRIDGE_CACHE_BACKEND: "memory" or "sqlite:///path/to/cache.db" """
+    if spec == "memory":
+        return MemoryCacheBackend()
+    if spec.startswith("sqlite://"):
+        return SQLiteCacheBackend(spec[len("sqlite://"):])
+    raise ValueError(f"Unsupported cache backend: {spec}")
+
+
+cache_backend = make_cache_backend(CACHE_BACKEND)
+result_store = ResultStore(RESULT_DIR, RESULT_TTL, cache_backend)
+
+
+# Resource cache and native describe
+class ResourceCache:
+    """kubectl list results kept in a cache backend, indexed by (namespace, name).
+
+    Lists read by requests within the keep-warm window are refetched in
+    the background once per refresh interval and kept until the next
+    refresh, so requests for them do not wait on kubectl. A lease in the
+    backend makes a single replica refresh each list per interval.
+    """
+
+    def __init__(self, backend, ttl, keep_warm, refresh_interval):
+        self.backend = backend
+        self.ttl = ttl
+        self.keep_warm = keep_warm
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._fetch_locks = {}
+        self._indexes = {}
+        self._views = {}
+        self._last_read = {}
+        self._thread = None
+        # Snapshot lists {key: (saved_at, items)}, served only until warm-up ends
+        self.fallback = {}
+        self.serve_fallback = False
+
+    @staticmethod
+    def _key(resource, namespace):
+        return f"list:{resource}:{namespace or ''}"
+
+    def list(self, resource, namespace=None, refresh=False):
+        """Return {(namespace, name): object} for a resource, fetching it when stale.
+
+        namespace=None lists cluster-scoped resources, "*" lists all namespaces.
+        A namespace is served from a cached all-namespaces list when there is one.
+        The same dict is returned for as long as the backend version is unchanged.
+        """
+        if namespace not in (None, "*") and not refresh:
+            key = self._key(resource, "*")
+            entry = self._lookup(key)
+            if entry is not None:
+                self._touch(resource, "*")
+                return self._namespace_view(key, entry, namespace)
+
+        self._touch(resource, namespace)
+        return self._fetch(resource, namespace, refresh)
+
+    def prefetch(self, resource, namespace=None):
+        """Fetch a list now and keep it for a refresh interval, without marking it as read"""
+        self.backend.acquire_lease(f"refresh:{self._key(resource, namespace)}", self.refresh_interval)
+        return self._fetch(resource, namespace, refresh=True, ttl=self.refresh_interval + self.ttl)
+
+    def _fetch(self, resource, namespace, refresh, ttl=None):
+        key = self._key(resource, namespace)
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # One fetch per key at a time; concurrent callers reuse its result
+        with fetch_lock:
+            entry = None if refresh else self._lookup(key)
+            if entry is None:
+                args = ["get", resource, "-o", "json"]
+                if namespace == "*":
+                    args.append("--all-namespaces")
+                elif namespace:
+                    args.extend(["-n", namespace])
+
+                result = execute_kubectl_command(args, spill=False)
+                if "error" in result:
+                    raise RuntimeError(result["error"])
+
+                items = result.get("items", [])
+                entry = (self.backend.set(key, items, ttl or self.ttl), items)
+            return self._index(key, entry)
+
+    def _lookup(self, key):
+        """Backend entry, or during warm-up a snapshot list that keeps its original age"""
+        entry = self.backend.get(key)
+        if entry is None and self.serve_fallback:
+            snapshot = self.fallback.get(key)
+            if snapshot and time.time() - snapshot[0] <= SNAPSHOT_MAX_AGE:
+                entry = (("snapshot", snapshot[0]), snapshot[1])
+        return entry
+
+    def _touch(self, resource, namespace):
+        with self._lock:
+            self._last_read[(resource, namespace)] = time.monotonic()
+
+    def _index(self, key, entry):
+        version, items = entry
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached and cached[0] == version:
+                return cached[1]
+        index = {}
+        for item in items:
+            metadata = item.get("metadata", {})
+            index[(metadata.get("namespace", ""), metadata.get("name"))] = item
+        with self._lock:
+            self._indexes[key] = (version, index)
+        return index
+
+    def _namespace_view(self, key, entry, namespace):
+        """One namespace of an all-namespaces list, memoized per version"""
+        version = entry[0]
+        with self._lock:
+            cached = self._views.get((key, namespace))
+            if cached and cached[0] == version:
+                return cached[1]
+        view = {k: v for k, v in self._index(key, entry).items() if k[0] == namespace}
+        with self._lock:
+            self._views[(key, namespace)] = (version, view)
+        return view
+
+    def get(self, resource, name, namespace=None):
+        """Return a single cached object, refreshing once if it is not found"""
+        key = (namespace or "", name)
+        obj = self.list(resource, namespace).get(key)
+        if obj is None:
+            obj = self.list(resource, namespace, refresh=True).get(key)
+        return obj
+
+    def invalidate(self, resource=None):
+        """Drop cached lists for one resource type, or everything"""
+        self.backend.invalidate(f"list:{resource}:" if resource else "list:")
+
+    def start_refresher(self):
+        """Keep recently read lists fresh in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refresh_loop, name="cache-refresh", daemon=True)
+            self._thread.start()
+
+    def _refresh_loop(self):
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+        while True:
+            started = time.monotonic()
+            with self._lock:
+                hot = [k for k, read_at in self._last_read.items() if started - read_at < self.keep_warm]
+                for k in [k for k in self._last_read if k not in hot]:
+                    del self._last_read[k]
+            # Only lists whose lease this replica wins are fetched, in parallel
+            due = [k for k in hot
+                   if self.backend.acquire_lease(f"refresh:{self._key(*k)}", self.refresh_interval)]
+            concurrent.futures.wait([pool.submit(self._refresh, *k) for k in due])
+            # Ticks are cheap lease checks; newly read lists are picked up before their TTL ends
+            time.sleep(max(0, self.ttl / 2 - (time.monotonic() - started)))
+
+    def _refresh(self, resource, namespace):
+        try:
+            self._fetch(resource, namespace, refresh=True, ttl=self.refresh_interval + self.ttl)
+        except Exception as e:
+            logger.warning(f"Background refresh of {resource} failed: {e}")
+
+
+class EventStore:
+    """Events from the resource cache, indexed by involved object"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._indexes = {}
+
+    def for_object(self, kind, name, namespace):
+        """Return events for an object, oldest first"""
+        events = self.cache.list("events", namespace)
+        with self._lock:
+            cached = self._indexes.get(namespace)
+            # Rebuild the index only when the cache has fetched a new list
+            if cached is None or cached[0] is not events:
+                index = {}
+                for event in events.values():
+                    obj = event.get("involvedObject", {})
+                    index.setdefault((obj.get("kind"), obj.get("name")), []).append(event)
+                for items in index.values():
+                    items.sort(key=_event_time)
+                cached = (events, index)
+                self._indexes[namespace] = cached
+        return cached[1].get((kind, name), [])
+
+
+resource_cache = ResourceCache(cache_backend, CACHE_TTL, CACHE_KEEP_WARM, CACHE_REFRESH_INTERVAL)
+event_store = EventStore(resource_cache)
+
+# Number of most recent events included in a describe result
+DESCRIBE_EVENT_LIMIT = 10
+
+
+def _event_time(event):
+    return (event.get("lastTimestamp") or event.get("eventTime")
+            or event.get("metadata", {}).get("creationTimestamp") or "")
+
+
+def _compact(value):
+    """Drop empty values so summaries stay small"""
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [_compact(v) for v in value]
+    return value
+
+
+def _conditions(status):
+    return {c.get("type"): c.get("status") for c in status.get("conditions", [])}
+
+
+def _container_state(state):
+    if not state:
+        return None
+    if "running" in state:
+        return "running"
+    if "waiting" in state:
+        reason = state["waiting"].get("reason")
+        return f"waiting: {reason}" if reason else "waiting"
+    if "terminated" in state:
+        terminated = state["terminated"]
+        return f"terminated: {terminated.get('reason', '')} (exit {terminated.get('exitCode')})"
+    return None
+
+
+def _owner(metadata):
+    for ref in metadata.get("ownerReferences", []):
+        if ref.get("controller"):
+            return f"{ref.get('kind')}/{ref.get('name')}"
+    return None
+
+
+def _selector_matches(selector, labels):
+    """Evaluate a LabelSelector (matchLabels and matchExpressions) against a label map"""
+    if any(labels.get(k) != v for k, v in selector.get("matchLabels", {}).items()):
+        return False
+    for expression in selector.get("matchExpressions", []):
+        key, operator = expression.get("key"), expression.get("operator")
+        values = expression.get("values") or []
+        if operator == "In":
+            matched = key in labels and labels[key] in values
+        elif operator == "NotIn":
+            matched = key not in labels or labels[key] not in values
+        elif operator == "Exists":
+            matched = key in labels
+        elif operator == "DoesNotExist":
+            matched = key not in labels
         else:
-            return {"error": f"Tool {tool_name} not implemented yet"}
-        
-    except Exception as e:
-        logger.error(f"Error calling tool {tool_name}: {e}")
+            raise ValueError(f"Unsupported selector operator: {operator}")
+        if not matched:
+            return False
+    return True
+
+
+def _select_pods(namespace, selector):
+    """Return cached pods in a namespace matching a LabelSelector"""
+    if not selector:
+        return []
+    pods = resource_cache.list("pods", namespace)
+    return [pod for pod in pods.values() if _selector_matches(selector, pod["metadata"].get("labels", {}))]
+
+
+def _pod_phases(pods):
+    phases = {}
+    for pod in pods:
+        phase = pod.get("status", {}).get("phase", "Unknown")
+        phases[phase] = phases.get(phase, 0) + 1
+    return phases
+
+
+def _pod_images(pod_spec):
+    return [c.get("image") for c in pod_spec.get("containers", [])]
+
+
+def _describe_pod(pod, namespace):
+    spec = pod.get("spec", {})
+    status = pod.get("status", {})
+    statuses = {c["name"]: c for c in status.get("containerStatuses", [])}
+
+    containers = []
+    for container in spec.get("containers", []):
+        container_status = statuses.get(container["name"], {})
+        containers.append({
+            "name": container["name"],
+            "image": container.get("image"),
+            "ready": container_status.get("ready", False),
+            "restarts": container_status.get("restartCount", 0),
+            "state": _container_state(container_status.get("state")),
+            "lastState": _container_state(container_status.get("lastState")),
+        })
+
+    return {
+        "phase": status.get("phase"),
+        "reason": status.get("reason"),
+        "node": spec.get("nodeName"),
+        "podIP": status.get("podIP"),
+        "qosClass": status.get("qosClass"),
+        "controlledBy": _owner(pod.get("metadata", {})),
+        "conditions": _conditions(status),
+        "containers": containers,
+    }
+
+
+def _describe_deployment(deployment, namespace):
+    spec = deployment.get("spec", {})
+    status = deployment.get("status", {})
+    selector = spec.get("selector", {})
+    return {
+        "replicas": {
+            "desired": spec.get("replicas", 1),
+            "updated": status.get("updatedReplicas", 0),
+            "ready": status.get("readyReplicas", 0),
+            "available": status.get("availableReplicas", 0),
+            "unavailable": status.get("unavailableReplicas", 0),
+        },
+        "strategy": spec.get("strategy", {}).get("type"),
+        "selector": selector,
+        "images": _pod_images(spec.get("template", {}).get("spec", {})),
+        "conditions": _conditions(status),
+        "pods": _pod_phases(_select_pods(namespace, selector)),
+    }
+
+
+def _describe_statefulset(statefulset, namespace):
+    spec = statefulset.get("spec", {})
+    status = statefulset.get("status", {})
+    selector = spec.get("selector", {})
+    return {
+        "replicas": {
+            "desired": spec.get("replicas", 1),
+            "current": status.get("currentReplicas", 0),
+            "updated": status.get("updatedReplicas", 0),
+            "ready": status.get("readyReplicas", 0),
+        },
+        "serviceName": spec.get("serviceName"),
+        "updateStrategy": spec.get("updateStrategy", {}).get("type"),
+        "selector": selector,
+        "images": _pod_images(spec.get("template", {}).get("spec", {})),
+        "pods": _pod_phases(_select_pods(namespace, selector)),
+    }
+
+
+def _describe_service(service, namespace):
+    spec = service.get("spec", {})
+    ports = []
+    for port in spec.get("ports", []):
+        entry = f"{port.get('port')}/{port.get('protocol', 'TCP')}->{port.get('targetPort')}"
+        if port.get("nodePort"):
+            entry += f" (nodePort {port['nodePort']})"
+        ports.append(entry)
+
+    # Ready endpoints are derived from cached pods instead of the Endpoints object
+    endpoints = [
+        pod.get("status", {}).get("podIP")
+        for pod in _select_pods(namespace, {"matchLabels": spec["selector"]} if spec.get("selector") else None)
+        if _conditions(pod.get("status", {})).get("Ready") == "True"
+    ]
+    ingress = service.get("status", {}).get("loadBalancer", {}).get("ingress", [])
+
+    return {
+        "type": spec.get("type"),
+        "clusterIP": spec.get("clusterIP"),
+        "externalIPs": spec.get("externalIPs"),
+        "loadBalancer": [i.get("ip") or i.get("hostname") for i in ingress],
+        "ports": ports,
+        "selector": spec.get("selector"),
+        "endpointCount": len(endpoints),
+        "endpoints": endpoints[:DESCRIBE_EVENT_LIMIT],
+    }
+
+
+def _describe_node(node, namespace):
+    metadata = node.get("metadata", {})
+    spec = node.get("spec", {})
+    status = node.get("status", {})
+    roles = [
+        label.split("/", 1)[1] for label in metadata.get("labels", {})
+        if label.startswith("node-role.kubernetes.io/")
+    ]
+    resources = ("cpu", "memory", "pods")
+    node_info = status.get("nodeInfo", {})
+    return {
+        "roles": roles,
+        "unschedulable": spec.get("unschedulable", False),
+        "conditions": _conditions(status),
+        "addresses": {a.get("type"): a.get("address") for a in status.get("addresses", [])},
+        "capacity": {r: status.get("capacity", {}).get(r) for r in resources},
+        "allocatable": {r: status.get("allocatable", {}).get(r) for r in resources},
+        "taints": [
+            f"{t.get('key')}{'=' + t['value'] if t.get('value') else ''}:{t.get('effect')}"
+            for t in spec.get("taints", [])
+        ],
+        "kubeletVersion": node_info.get("kubeletVersion"),
+        "osImage": node_info.get("osImage"),
+        "containerRuntime": node_info.get("containerRuntimeVersion"),
+    }
+
+
+def _describe_pvc(pvc, namespace):
+    spec = pvc.get("spec", {})
+    status = pvc.get("status", {})
+    name = pvc["metadata"]["name"]
+    used_by = [
+        pod["metadata"]["name"]
+        for pod in resource_cache.list("pods", namespace).values()
+        if any(v.get("persistentVolumeClaim", {}).get("claimName") == name
+               for v in pod.get("spec", {}).get("volumes", []))
+    ]
+    return {
+        "phase": status.get("phase"),
+        "volume": spec.get("volumeName"),
+        "storageClass": spec.get("storageClassName"),
+        "capacity": status.get("capacity", {}).get("storage"),
+        "requested": spec.get("resources", {}).get("requests", {}).get("storage"),
+        "accessModes": spec.get("accessModes"),
+        "usedBy": used_by,
+    }
+
+
+# resourceType aliases -> (kind, kubectl resource, namespaced, describer)
+DESCRIBE_KINDS = {}
+for _aliases, _kind, _resource, _namespaced, _describer in [
+    (("pod", "pods", "po"), "Pod", "pods", True, _describe_pod),
+    (("deployment", "deployments", "deploy"), "Deployment", "deployments", True, _describe_deployment),
+    (("statefulset", "statefulsets", "sts"), "StatefulSet", "statefulsets", True, _describe_statefulset),
+    (("service", "services", "svc"), "Service", "services", True, _describe_service),
+    (("node", "nodes", "no"), "Node", "nodes", False, _describe_node),
+    (("persistentvolumeclaim", "persistentvolumeclaims", "pvc"),
+     "PersistentVolumeClaim", "persistentvolumeclaims", True, _describe_pvc),
+]:
+    for _alias in _aliases:
+        DESCRIBE_KINDS[_alias] = (_kind, _resource, _namespaced, _describer)
+
+
+def _render_describe_text(result):
+    """Render a native describe result as compact indented text"""
+    lines = []
+
+    def emit(key, value, indent):
+        pad = "  " * indent
+        if isinstance(value, dict):
+            lines.append(f"{pad}{key}:")
+            for k, v in value.items():
+                emit(k, v, indent + 1)
+        elif isinstance(value, list):
+            lines.append(f"{pad}{key}:")
+            for item in value:
+                if isinstance(item, dict):
+                    item = ", ".join(f"{k}={v}" for k, v in item.items())
+                lines.append(f"{pad}  - {item}")
+        else:
+            lines.append(f"{pad}{key}: {value}")
+
+    for key in ("kind", "name", "namespace"):
+        if result.get(key):
+            emit(key, result[key], 0)
+    for key, value in result["summary"].items():
+        emit(key, value, 0)
+    if result.get("events"):
+        emit("events", result["events"], 0)
+    return "\n".join(lines)
+
+
+def describe_native(resource_type, name, namespace="default", include_text=False):
+    """Describe a resource from the resource cache and event store"""
+    kind, resource, namespaced, describer = DESCRIBE_KINDS[resource_type.lower()]
+    scope = namespace if namespaced else None
+
+    try:
+        obj = resource_cache.get(resource, name, scope)
+        if obj is None:
+            where = f' in namespace "{namespace}"' if namespaced else ""
+            return {"error": f'{kind} "{name}" not found{where}'}
+
+        summary = describer(obj, scope)
+        # Node events are recorded in the default namespace
+        events = event_store.for_object(kind, name, scope or "default")
+    except RuntimeError as e:
         return {"error": str(e)}
 
-# OpenAPI specification for Open WebUI - Complete k8s-mcp-server capabilities
-OPENAPI_SPEC = {
-    "openapi": "3.0.0",
-    "info": {
-        "title": "Kubernetes Management Tools",
-        "version": "1.0.0",
-        "description": "Complete Kubernetes management via kubectl, helm, istioctl, and argocd"
-    },
-    "servers": [{"url": "/", "description": "Kubernetes Tools"}],
-    "paths": {
-        "/health": {
-            "get": {
-                "summary": "Health check",
-                "operationId": "health_check",
-                "responses": {"200": {"description": "Service is healthy"}}
-            }
+    result = {
+        "kind": kind,
+        "name": name,
+        "namespace": scope,
+        "summary": _compact(summary),
+        "events": [
+            _compact({
+                "type": e.get("type"),
+                "reason": e.get("reason"),
+                "message": e.get("message"),
+                "count": e.get("count"),
+                "lastSeen": _event_time(e),
+            })
+            for e in events[-DESCRIBE_EVENT_LIMIT:]
+        ],
+    }
+    if include_text:
+        result["text"] = _render_describe_text(result)
+    return result
+
+# Cluster health aggregation
+class ColumnStore:
+    """Column-oriented views of cached lists, rebuilt only when the cache refetches"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._columns = {}
+
+    def columns(self, resource, namespace, builder):
+        items = self.cache.list(resource, namespace)
+        key = (resource, namespace)
+        with self._lock:
+            cached = self._columns.get(key)
+            if cached is None or cached[0] is not items:
+                cached = (items, builder(items.values()))
+                self._columns[key] = cached
+        return cached[1]
+
+
+column_store = ColumnStore(resource_cache)
+
+NODE_PRESSURE_CONDITIONS = ("MemoryPressure", "DiskPressure", "PIDPressure", "NetworkUnavailable")
+
+
+def _pod_columns(pods):
+    """Pod and container status fields as parallel lists"""
+    cols = {k: [] for k in ("namespace", "phase", "status",
+                            "c_namespace", "c_pod", "c_container", "c_restarts", "c_reason")}
+    for pod in pods:
+        metadata = pod.get("metadata", {})
+        status = pod.get("status", {})
+        namespace = metadata.get("namespace", "")
+        phase = status.get("phase", "Unknown")
+
+        # Same precedence as the kubectl STATUS column: container waiting reason, pod reason, phase
+        display = status.get("reason") or phase
+        for container in status.get("containerStatuses", []):
+            waiting = container.get("state", {}).get("waiting")
+            if waiting and waiting.get("reason"):
+                display = waiting["reason"]
+            cols["c_namespace"].append(namespace)
+            cols["c_pod"].append(metadata.get("name"))
+            cols["c_container"].append(container.get("name"))
+            cols["c_restarts"].append(container.get("restartCount", 0))
+            cols["c_reason"].append(container.get("lastState", {}).get("terminated", {}).get("reason"))
+
+        cols["namespace"].append(namespace)
+        cols["phase"].append(phase)
+        cols["status"].append(display)
+    return cols
+
+
+def _deployment_columns(deployments):
+    cols = {k: [] for k in ("namespace", "name", "desired", "available")}
+    for deployment in deployments:
+        metadata = deployment.get("metadata", {})
+        cols["namespace"].append(metadata.get("namespace", ""))
+        cols["name"].append(metadata.get("name"))
+        cols["desired"].append(deployment.get("spec", {}).get("replicas", 1))
+        cols["available"].append(deployment.get("status", {}).get("availableReplicas", 0))
+    return cols
+
+
+def _node_columns(nodes):
+    cols = {k: [] for k in ("name", "ready", "pressure", "unschedulable")}
+    for node in nodes:
+        conditions = _conditions(node.get("status", {}))
+        cols["name"].append(node.get("metadata", {}).get("name"))
+        cols["ready"].append(conditions.get("Ready") == "True")
+        cols["pressure"].append([c for c in NODE_PRESSURE_CONDITIONS if conditions.get(c) == "True"])
+        cols["unschedulable"].append(node.get("spec", {}).get("unschedulable", False))
+    return cols
+
+
+def cluster_summary(namespace=None, top=10):
+    """Aggregate pod, deployment and node health into a few compact facts"""
+    scope = namespace or "*"
+    try:
+        pods = column_store.columns("pods", scope, _pod_columns)
+        deployments = column_store.columns("deployments", scope, _deployment_columns)
+        nodes = column_store.columns("nodes", None, _node_columns)
+    except RuntimeError as e:
+        return {"error": str(e)}
+
+    # Pods not Running, per namespace and status
+    not_running = {}
+    counts = Counter(
+        (ns, status)
+        for ns, phase, status in zip(pods["namespace"], pods["phase"], pods["status"])
+        if phase != "Succeeded" and status != "Running"
+    )
+    for (ns, status), count in counts.items():
+        not_running.setdefault(ns, {})[status] = count
+
+    restarts = pods["c_restarts"]
+    top_restarts = [
+        _compact({
+            "namespace": pods["c_namespace"][i],
+            "pod": pods["c_pod"][i],
+            "container": pods["c_container"][i],
+            "restarts": restarts[i],
+            "lastReason": pods["c_reason"][i],
+        })
+        for i in heapq.nlargest(top, range(len(restarts)), key=restarts.__getitem__)
+        if restarts[i] > 0
+    ]
+
+    unavailable = [
+        {"namespace": ns, "name": name, "desired": desired, "available": available}
+        for ns, name, desired, available in zip(
+            deployments["namespace"], deployments["name"],
+            deployments["desired"], deployments["available"])
+        if available < desired
+    ]
+
+    unhealthy_nodes = [
+        _compact({"name": name, "ready": ready, "pressure": pressure, "unschedulable": unschedulable})
+        for name, ready, pressure, unschedulable in zip(
+            nodes["name"], nodes["ready"], nodes["pressure"], nodes["unschedulable"])
+        if not ready or pressure or unschedulable
+    ]
+
+    return {
+        "totals": {
+            "pods": len(pods["phase"]),
+            "podsNotRunning": sum(counts.values()),
+            "deployments": len(deployments["name"]),
+            "nodes": len(nodes["name"]),
         },
-        # kubectl operations
-        "/kubectl_get": {
+        "podsNotRunning": not_running,
+        "topRestarts": top_restarts,
+        "unavailableDeployments": unavailable,
+        "nodesUnhealthy": unhealthy_nodes,
+    }
+
+# Tool registry
+class ValidationError(ValueError):
+    """Request arguments rejected before any command is spawned"""
+
+
+# OpenAPI type -> accepted Python types
+JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "object": (dict,),
+}
+
+
+class Param:
+    """A tool argument: its schema and how it maps onto the command line.
+
+    flag is a string option (["-l", value], or just the flag for booleans)
+    or a callable returning the argv items for a value.
+    """
+
+    def __init__(self, type, description=None, default=None, enum=None, required=False, flag=None):
+        self.type = type
+        self.description = description
+        self.default = default
+        self.enum = enum
+        self.required = required
+        self.flag = flag
+
+    def schema(self):
+        schema = {"type": self.type}
+        if self.description:
+            schema["description"] = self.description
+        if self.enum:
+            schema["enum"] = self.enum
+        if self.default is not None:
+            schema["default"] = self.default
+        return schema
+
+
+class _Fields(dict):
+    """format_map source that renders missing or null arguments as empty strings"""
+
+    def __missing__(self, key):
+        return ""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        return "" if value is None else value
+
+
+class Tool:
+    """A bridge tool declared once: route, schema, validator and command builder.
+
+    command holds the leading argv tokens: "{field}" templates or callables
+    taking the validated arguments. Empty tokens are dropped. Fields used in
+    templates, and those callables place listed in positional, may not start
+    with "-". namespace is appended with namespace_flag when it is not
+    "default", then the mapped params in declaration order. A handler runs instead of a command; if it
+    returns None the command is run.
+    """
+
+    def __init__(self, name, path, summary, description, params, command=None, runner="kubectl",
+                 namespace_flag="-n", create_namespace=False, stdin=None, handler=None,
+                 tags=("kubectl",), response="Command result", operation_id=None, body_required=True,
+                 positional=()):
+        self.name = name
+        self.path = path
+        self.summary = summary
+        self.description = description
+        self.params = params
+        self.command = command or []
+        self.runner = runner
+        self.namespace_flag = namespace_flag
+        self.create_namespace = create_namespace
+        self.stdin = stdin
+        self.handler = handler
+        self.tags = list(tags)
+        self.response = response
+        self.operation_id = operation_id or path.strip("/")
+        self.body_required = body_required
+        self.positional = positional
+        self.validate = self._compile_validator()
+
+    def _compile_validator(self):
+        # Values substituted into positional tokens must not be read as flags
+        templates = " ".join(t for t in self.command if isinstance(t, str))
+        positional = set(re.findall(r"\{(\w+)\}", templates)) | set(self.positional)
+        checks = [_compile_param_check(name, param, name in positional)
+                  for name, param in self.params.items()]
+
+        def validate(arguments):
+            if arguments is None:
+                arguments = {}
+            if not isinstance(arguments, dict):
+                raise ValidationError("Request body must be a JSON object")
+            args = dict(arguments)
+            for check in checks:
+                check(args)
+            return args
+
+        return validate
+
+    def build(self, args):
+        """Build the argv for validated arguments"""
+        fields = _Fields(args)
+        argv = []
+        for token in self.command:
+            value = token(args) if callable(token) else token.format_map(fields)
+            if value:
+                argv.append(value)
+
+        namespace = args.get("namespace", "default")
+        if self.namespace_flag and namespace != "default":
+            argv.extend([self.namespace_flag, namespace])
+            if self.create_namespace:
+                argv.append("--create-namespace")
+
+        for name, param in self.params.items():
+            value = args.get(name)
+            if param.flag is None or value in (None, False, "", {}):
+                continue
+            if callable(param.flag):
+                argv.extend(param.flag(value))
+            elif param.type == "boolean":
+                argv.append(param.flag)
+            else:
+                argv.extend([param.flag, str(value)])
+        return argv
+
+    def run(self, args):
+        if self.handler:
+            result = self.handler(args)
+            if result is not None or not self.command:
+                return result
+
+        argv = self.build(args)
+        input_data = args.get(self.stdin) if self.stdin else None
+        if self.runner == "helm":
+            return execute_helm_command(["helm"] + argv, input_data=input_data)
+        return execute_kubectl_command(argv, input_data=input_data)
+
+    def operation(self):
+        """OpenAPI operation object for this tool"""
+        schema = {
+            "type": "object",
+            "properties": {name: param.schema() for name, param in self.params.items()},
+        }
+        required = [name for name, param in self.params.items() if param.required]
+        if required:
+            schema["required"] = required
+        return {
             "post": {
-                "summary": "Get Kubernetes Resources",
-                "description": "List or get Kubernetes resources (pods, services, deployments, etc.)",
-                "operationId": "kubectl_get",
-                "tags": ["kubectl"],
+                "summary": self.summary,
+                "description": self.description,
+                "operationId": self.operation_id,
+                "tags": self.tags,
                 "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "resourceType": {"type": "string", "description": "Resource type (pods, services, deployments, etc.)"},
-                                    "name": {"type": "string", "description": "Resource name (optional)"},
-                                    "namespace": {"type": "string", "default": "default", "description": "Namespace"},
-                                    "output": {"type": "string", "enum": ["json", "yaml", "wide", "name"], "default": "json"},
-                                    "allNamespaces": {"type": "boolean", "default": False},
-                                    "labelSelector": {"type": "string", "description": "Label selector"},
-                                    "fieldSelector": {"type": "string", "description": "Field selector"}
-                                },
-                                "required": ["resourceType"]
-                            }
-                        }
-                    }
+                    "required": self.body_required,
+                    "content": {"application/json": {"schema": schema}},
                 },
-                "responses": {"200": {"description": "Resource information"}}
+                "responses": {"200": {"description": self.response}},
             }
+        }
+
+
+def _compile_param_check(name, param, positional):
+    """Return a closure that validates one argument and fills its default"""
+    types = JSON_TYPES[param.type]
+    enum = set(param.enum) if param.enum else None
+
+    def check(args):
+        value = args.get(name)
+        if value is None or value == "":
+            if param.required:
+                raise ValidationError(f"'{name}' is required")
+            # Models often send null for optional fields; treat it as omitted
+            if param.default is not None:
+                args[name] = param.default
+            else:
+                args.pop(name, None)
+            return
+        # bool is an int subclass; only accept it where a boolean is declared
+        if isinstance(value, bool) and param.type != "boolean":
+            raise ValidationError(f"'{name}' must be of type {param.type}")
+        # Tool-calling models often send whole numbers as 5.0 or "5"
+        if param.type == "integer" and isinstance(value, float) and value.is_integer():
+            value = args[name] = int(value)
+        elif param.type == "integer" and isinstance(value, str) and re.fullmatch(r"-?\d+", value.strip()):
+            value = args[name] = int(value)
+        if not isinstance(value, types):
+            raise ValidationError(f"'{name}' must be of type {param.type}")
+        if enum and value not in enum:
+            raise ValidationError(f"'{name}' must be one of {', '.join(map(str, param.enum))}")
+        if positional and str(value).startswith("-"):
+            raise ValidationError(f"'{name}' must not start with '-'")
+
+    return check
+
+
+def dict_to_set_args(d, prefix=""):
+    """Convert nested helm values to --set arguments"""
+    set_args = []
+    for key, value in d.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            set_args.extend(dict_to_set_args(value, full_key))
+        else:
+            set_args.extend(["--set", f"{full_key}={value}"])
+    return set_args
+
+
+def _describe_handler(args):
+    if args["native"] and args["resourceType"].lower() in DESCRIBE_KINDS:
+        return describe_native(args["resourceType"], args["name"], args["namespace"],
+                               include_text=args["includeText"])
+    return None
+
+
+def _logs_target(args):
+    if args["resourceType"] == "deployment":
+        return f"deployment/{args['name']}"
+    return args["name"]
+
+
+def _namespace_param():
+    return Param("string", default="default")
+
+
+TOOL_REGISTRY = [
+    # kubectl operations
+    Tool(
+        "kubectl_get", "/kubectl_get",
+        "Get Kubernetes Resources",
+        "List or get Kubernetes resources (pods, services, deployments, etc.)",
+        {
+            "resourceType": Param("string", "Resource type (pods, services, deployments, etc.)", required=True),
+            "name": Param("string", "Resource name (optional)"),
+            "namespace": Param("string", "Namespace", default="default"),
+            "output": Param("string", enum=["json", "yaml", "wide", "name"], default="json", flag="-o"),
+            "allNamespaces": Param("boolean", default=False, flag="--all-namespaces"),
+            "labelSelector": Param("string", "Label selector", flag="-l"),
+            "fieldSelector": Param("string", "Field selector", flag="--field-selector"),
         },
-        "/kubectl_describe": {
-            "post": {
-                "summary": "Describe Kubernetes Resources",
-                "description": "Get detailed information about Kubernetes resources",
-                "operationId": "kubectl_describe",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "resourceType": {"type": "string", "description": "Resource type"},
-                                    "name": {"type": "string", "description": "Resource name"},
-                                    "namespace": {"type": "string", "default": "default"}
-                                },
-                                "required": ["resourceType", "name"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Detailed resource information"}}
-            }
+        command=["get", "{resourceType}", "{name}"],
+        response="Resource information",
+    ),
+    Tool(
+        "kubectl_describe", "/kubectl_describe",
+        "Describe Kubernetes Resources",
+        "Get a compact structured summary of a Kubernetes resource with its recent events",
+        {
+            "resourceType": Param("string", "Resource type", required=True),
+            "name": Param("string", "Resource name", required=True),
+            "namespace": _namespace_param(),
+            "includeText": Param("boolean", "Also return a compact text rendering", default=False),
+            "native": Param("boolean", "Use the cached summary for Pod, Deployment, StatefulSet, Service, Node and PVC; false runs kubectl describe", default=True),
         },
-        "/kubectl_apply": {
-            "post": {
-                "summary": "Apply Kubernetes Manifests",
-                "description": "Apply YAML manifests to create or update resources",
-                "operationId": "kubectl_apply",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "manifest": {"type": "string", "description": "YAML manifest content"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "dryRun": {"type": "boolean", "default": False}
-                                }
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Apply result"}}
-            }
+        command=["describe", "{resourceType}", "{name}"],
+        handler=_describe_handler,
+        response="Detailed resource information",
+    ),
+    Tool(
+        "kubectl_apply", "/kubectl_apply",
+        "Apply Kubernetes Manifests",
+        "Apply YAML manifests to create or update resources",
+        {
+            "manifest": Param("string", "YAML manifest content", required=True),
+            "namespace": _namespace_param(),
+            "dryRun": Param("boolean", default=False, flag="--dry-run=client"),
         },
-        "/kubectl_delete": {
-            "post": {
-                "summary": "Delete Kubernetes Resources",
-                "description": "Delete Kubernetes resources",
-                "operationId": "kubectl_delete",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "resourceType": {"type": "string", "description": "Resource type"},
-                                    "name": {"type": "string", "description": "Resource name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "force": {"type": "boolean", "default": False}
-                                },
-                                "required": ["resourceType", "name"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Delete result"}}
-            }
+        command=["apply", "-f", "-"],  # Read from stdin
+        stdin="manifest",
+        response="Apply result",
+    ),
+    Tool(
+        "kubectl_delete", "/kubectl_delete",
+        "Delete Kubernetes Resources",
+        "Delete Kubernetes resources",
+        {
+            "resourceType": Param("string", "Resource type", required=True),
+            "name": Param("string", "Resource name", required=True),
+            "namespace": _namespace_param(),
+            "force": Param("boolean", default=False, flag="--force"),
         },
-        "/kubectl_logs": {
-            "post": {
-                "summary": "Get Pod Logs",
-                "description": "Retrieve logs from pods or deployments",
-                "operationId": "kubectl_logs",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "resourceType": {"type": "string", "enum": ["pod", "deployment"], "default": "pod"},
-                                    "name": {"type": "string", "description": "Resource name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "container": {"type": "string", "description": "Container name (optional)"},
-                                    "tail": {"type": "number", "description": "Number of lines to show"},
-                                    "follow": {"type": "boolean", "default": False}
-                                },
-                                "required": ["name", "namespace"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Log output"}}
-            }
+        command=["delete", "{resourceType}", "{name}"],
+        response="Delete result",
+    ),
+    Tool(
+        "kubectl_logs", "/kubectl_logs",
+        "Get Pod Logs",
+        "Retrieve logs from pods or deployments",
+        {
+            "resourceType": Param("string", enum=["pod", "deployment"], default="pod"),
+            "name": Param("string", "Resource name", required=True),
+            "namespace": Param("string", default="default", required=True),
+            "container": Param("string", "Container name (optional)", flag="-c"),
+            "tail": Param("integer", "Number of lines to show", flag="--tail"),
+            "follow": Param("boolean", default=False, flag="-f"),
         },
-        "/kubectl_scale": {
-            "post": {
-                "summary": "Scale Kubernetes Resources",
-                "description": "Scale deployments, statefulsets, or replicasets",
-                "operationId": "kubectl_scale",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Resource name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "replicas": {"type": "number", "description": "Number of replicas"},
-                                    "resourceType": {"type": "string", "default": "deployment"}
-                                },
-                                "required": ["name", "replicas"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Scale result"}}
-            }
+        command=["logs", _logs_target],
+        positional=("name",),
+        response="Log output",
+    ),
+    Tool(
+        "kubectl_scale", "/kubectl_scale",
+        "Scale Kubernetes Resources",
+        "Scale deployments, statefulsets, or replicasets",
+        {
+            "name": Param("string", "Resource name", required=True),
+            "namespace": _namespace_param(),
+            "replicas": Param("integer", "Number of replicas", required=True),
+            "resourceType": Param("string", default="deployment"),
         },
-        # Helm operations
-        "/helm_install": {
-            "post": {
-                "summary": "Install Helm Chart",
-                "description": "Install a Helm chart",
-                "operationId": "helm_install",
-                "tags": ["helm"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Release name"},
-                                    "chart": {"type": "string", "description": "Chart name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "repo": {"type": "string", "description": "Helm repository URL"},
-                                    "values": {"type": "object", "description": "Chart values"}
-                                },
-                                "required": ["name", "chart", "namespace"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Installation result"}}
-            }
+        command=["scale", "{resourceType}/{name}", "--replicas={replicas}"],
+        response="Scale result",
+    ),
+    Tool(
+        "cluster_summary", "/cluster_summary",
+        "Cluster Health Summary",
+        "Aggregated health facts: pods not Running per namespace, top restarting containers, deployments with unavailable replicas, and nodes that are NotReady, under pressure or cordoned",
+        {
+            "namespace": Param("string", "Limit pods and deployments to one namespace (default: all namespaces)"),
+            "top": Param("integer", "Number of top restarting containers", default=10),
         },
-        "/helm_upgrade": {
-            "post": {
-                "summary": "Upgrade Helm Release",
-                "description": "Upgrade an existing Helm release",
-                "operationId": "helm_upgrade",
-                "tags": ["helm"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Release name"},
-                                    "chart": {"type": "string", "description": "Chart name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "values": {"type": "object", "description": "Chart values"}
-                                },
-                                "required": ["name", "chart", "namespace"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Upgrade result"}}
-            }
+        handler=lambda args: cluster_summary(args.get("namespace"), args["top"]),
+        response="Cluster health summary",
+        body_required=False,
+    ),
+    Tool(
+        "fetch_result", "/fetch_result",
+        "Fetch Large Result",
+        "Read more of an oversized command output returned as a resultId handle, starting at a byte cursor",
+        {
+            "resultId": Param("string", "Handle returned with the truncated result", required=True),
+            "cursor": Param("integer", "Byte offset to read from (the cursor of the previous response)", default=0),
+            "limit": Param("integer", "Maximum bytes to return", default=RESULT_FETCH_BYTES),
+            "lines": Param("integer", "Return this many lines instead of a byte range"),
         },
-        "/helm_uninstall": {
-            "post": {
-                "summary": "Uninstall Helm Release",
-                "description": "Uninstall a Helm release",
-                "operationId": "helm_uninstall",
-                "tags": ["helm"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Release name"},
-                                    "namespace": {"type": "string", "default": "default"}
-                                },
-                                "required": ["name", "namespace"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Uninstall result"}}
-            }
+        handler=lambda args: result_store.fetch(args["resultId"], args["cursor"], args["limit"], args.get("lines")),
+        tags=("kubectl", "helm"),
+        response="Result chunk with the next cursor",
+    ),
+    # Helm operations
+    Tool(
+        "install_helm_chart", "/helm_install",
+        "Install Helm Chart",
+        "Install a Helm chart",
+        {
+            "name": Param("string", "Release name", required=True),
+            "chart": Param("string", "Chart name", required=True),
+            "namespace": Param("string", default="default", required=True),
+            "repo": Param("string", "Helm repository URL", flag="--repo"),
+            "values": Param("object", "Chart values", flag=dict_to_set_args),
         },
-        # Additional operations
-        "/exec_pod": {
-            "post": {
-                "summary": "Execute Command in Pod",
-                "description": "Execute a command inside a pod container",
-                "operationId": "exec_pod",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Pod name"},
-                                    "namespace": {"type": "string", "default": "default"},
-                                    "command": {"type": "string", "description": "Command to execute"},
-                                    "container": {"type": "string", "description": "Container name (optional)"}
-                                },
-                                "required": ["name", "command"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Command output"}}
+        command=["install", "{name}", "{chart}"],
+        runner="helm",
+        namespace_flag="--namespace",
+        create_namespace=True,
+        tags=("helm",),
+        response="Installation result",
+    ),
+    Tool(
+        "upgrade_helm_chart", "/helm_upgrade",
+        "Upgrade Helm Release",
+        "Upgrade an existing Helm release",
+        {
+            "name": Param("string", "Release name", required=True),
+            "chart": Param("string", "Chart name", required=True),
+            "namespace": Param("string", default="default", required=True),
+            "repo": Param("string", "Helm repository URL", flag="--repo"),
+            "values": Param("object", "Chart values", flag=dict_to_set_args),
+        },
+        command=["upgrade", "{name}", "{chart}"],
+        runner="helm",
+        namespace_flag="--namespace",
+        tags=("helm",),
+        response="Upgrade result",
+    ),
+    Tool(
+        "uninstall_helm_chart", "/helm_uninstall",
+        "Uninstall Helm Release",
+        "Uninstall a Helm release",
+        {
+            "name": Param("string", "Release name", required=True),
+            "namespace": Param("string", default="default", required=True),
+        },
+        command=["uninstall", "{name}"],
+        runner="helm",
+        namespace_flag="--namespace",
+        tags=("helm",),
+        response="Uninstall result",
+    ),
+    # Additional operations
+    Tool(
+        "exec_in_pod", "/exec_pod",
+        "Execute Command in Pod",
+        "Execute a command inside a pod container",
+        {
+            "name": Param("string", "Pod name", required=True),
+            "namespace": _namespace_param(),
+            "container": Param("string", "Container name (optional)", flag="-c"),
+            # Must stay last: everything after "--" goes to the container
+            "command": Param("string", "Command to execute", required=True,
+                             flag=lambda command: ["--", "sh", "-c", command]),
+        },
+        command=["exec", "-it", "{name}"],
+        response="Command output",
+    ),
+    Tool(
+        "port_forward", "/port_forward",
+        "Port Forward",
+        "Forward a local port to a pod or service",
+        {
+            "resourceType": Param("string", "Resource type (pod/service)", required=True),
+            "resourceName": Param("string", "Resource name", required=True),
+            "localPort": Param("integer", "Local port", required=True),
+            "targetPort": Param("integer", "Target port", required=True),
+            "namespace": _namespace_param(),
+        },
+        command=["port-forward", "{resourceType}/{resourceName}", "{localPort}:{targetPort}"],
+        response="Port forward result",
+    ),
+]
+
+# O(1) dispatch by tool name
+TOOLS = {tool.name: tool for tool in TOOL_REGISTRY}
+
+
+def call_mcp_tool_via_sse(tool_name, arguments):
+    """Validate arguments and run a registered tool.
+
+    Raises ValidationError for bad input; other failures are returned as {"error": ...}.
+    """
+    start = time.monotonic()
+    tool = TOOLS.get(tool_name)
+    if tool is None:
+        return {"error": f"Tool {tool_name} not implemented yet"}
+
+    try:
+        args = tool.validate(arguments)
+    except ValidationError as e:
+        log_tool_call(tool_name, arguments, {"error": str(e)}, time.monotonic() - start)
+        raise
+
+    try:
+        result = tool.run(args)
+    except Exception as e:
+        logger.error(f"Error calling tool {tool_name}: {e}")
+        result = {"error": str(e)}
+    log_tool_call(tool_name, arguments, result, time.monotonic() - start)
+    return result
+
+
+def build_openapi_spec():
+    """OpenAPI specification for Open WebUI, generated from the tool registry"""
+    paths = {
+        "/health": {
+            "get": {
+                "summary": "Health check",
+                "operationId": "health_check",
+                "responses": {"200": {"description": "Service is healthy"}}
             }
         },
-        "/port_forward": {
-            "post": {
-                "summary": "Port Forward",
-                "description": "Forward a local port to a pod or service",
-                "operationId": "port_forward",
-                "tags": ["kubectl"],
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "resourceType": {"type": "string", "description": "Resource type (pod/service)"},
-                                    "resourceName": {"type": "string", "description": "Resource name"},
-                                    "localPort": {"type": "number", "description": "Local port"},
-                                    "targetPort": {"type": "number", "description": "Target port"},
-                                    "namespace": {"type": "string", "default": "default"}
-                                },
-                                "required": ["resourceType", "resourceName", "localPort", "targetPort"]
-                            }
-                        }
-                    }
-                },
-                "responses": {"200": {"description": "Port forward result"}}
+        "/readyz": {
+            "get": {
+                "summary": "Readiness check",
+                "description": "Result of the last background check of kubectl/helm binaries and each kubeconfig context's API server",
+                "operationId": "readiness_check",
+                "responses": {
+                    "200": {"description": "Bridge and clusters are ready"},
+                    "503": {"description": "Not ready; see checks for the failing component"}
+                }
             }
-        }
+        },
+    }
+    for tool in TOOL_REGISTRY:
+        paths[tool.path] = tool.operation()
+    return {
+        "openapi": "3.0.0",
+        "info": {
+            "title": "Kubernetes Management Tools",
+            "version": "1.0.0",
+            "description": "Complete Kubernetes management via kubectl, helm, istioctl, and argocd"
+        },
+        "servers": [{"url": "/", "description": "Kubernetes Tools"}],
+        "paths": paths,
     }
-}
+
+
+OPENAPI_SPEC = build_openapi_spec()
+# Serialized once; clients revalidate with If-None-Match
+OPENAPI_JSON = json.dumps(OPENAPI_SPEC, sort_keys=True).encode()
+OPENAPI_ETAG = hashlib.sha256(OPENAPI_JSON).hexdigest()[:32]
+
 
 @app.route("/openapi.json", methods=["GET"])
 def get_openapi_spec():
     """Return OpenAPI specification for Open WebUI"""
-    return jsonify(OPENAPI_SPEC)
+    response = Response(OPENAPI_JSON, mimetype="application/json")
+    response.set_etag(OPENAPI_ETAG)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
     return jsonify({"status": "ok"})
 
-# kubectl operations
-@app.route("/kubectl_get", methods=["POST"])
-def kubectl_get():
-    """Execute kubectl get command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_get request: {data}")
-        
-        # Call MCP server
-        result = call_mcp_tool_via_sse("kubectl_get", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_get: {e}")
-        return jsonify({"error": str(e)}), 500
 
-@app.route("/kubectl_describe", methods=["POST"])
-def kubectl_describe():
-    """Execute kubectl describe command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_describe request: {data}")
-        
-        result = call_mcp_tool_via_sse("kubectl_describe", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_describe: {e}")
-        return jsonify({"error": str(e)}), 500
+class Gauge:
+    """Thread-safe counter"""
 
-@app.route("/kubectl_apply", methods=["POST"])
-def kubectl_apply():
-    """Execute kubectl apply command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_apply request: {data}")
-        
-        result = call_mcp_tool_via_sse("kubectl_apply", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_apply: {e}")
-        return jsonify({"error": str(e)}), 500
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0
 
-@app.route("/kubectl_delete", methods=["POST"])
-def kubectl_delete():
-    """Execute kubectl delete command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_delete request: {data}")
-        
-        result = call_mcp_tool_via_sse("kubectl_delete", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_delete: {e}")
-        return jsonify({"error": str(e)}), 500
+    def add(self, delta):
+        with self._lock:
+            self._value += delta
 
-@app.route("/kubectl_logs", methods=["POST"])
-def kubectl_logs():
-    """Execute kubectl logs command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_logs request: {data}")
-        
-        result = call_mcp_tool_via_sse("kubectl_logs", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_logs: {e}")
-        return jsonify({"error": str(e)}), 500
+    def value(self):
+        return self._value
 
-@app.route("/kubectl_scale", methods=["POST"])
-def kubectl_scale():
-    """Execute kubectl scale command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"kubectl_scale request: {data}")
-        
-        result = call_mcp_tool_via_sse("kubectl_scale", data)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error in kubectl_scale: {e}")
-        return jsonify({"error": str(e)}), 500
 
-# Helm operations
-@app.route("/helm_install", methods=["POST"])
-def helm_install():
-    """Execute helm install command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"helm_install request: {data}")
-        result = call_mcp_tool_via_sse("install_helm_chart", data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in helm_install: {e}")
-        return jsonify({"error": str(e)}), 500
+inflight_requests = Gauge()
 
-@app.route("/helm_upgrade", methods=["POST"])
-def helm_upgrade():
-    """Execute helm upgrade command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"helm_upgrade request: {data}")
-        result = call_mcp_tool_via_sse("upgrade_helm_chart", data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in helm_upgrade: {e}")
-        return jsonify({"error": str(e)}), 500
 
-@app.route("/helm_uninstall", methods=["POST"])
-def helm_uninstall():
-    """Execute helm uninstall command via MCP server"""
-    try:
-        data = request.get_json()
-        logger.info(f"helm_uninstall request: {data}")
-        result = call_mcp_tool_via_sse("uninstall_helm_chart", data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in helm_uninstall: {e}")
-        return jsonify({"error": str(e)}), 500
+def make_tool_view(tool):
+    """Flask view that runs one registered tool"""
+    def view():
+        inflight_requests.add(1)
+        try:
+            data = request.get_json(silent=True)
+            result = call_mcp_tool_via_sse(tool.name, data)
+            return jsonify(result)
+        except ValidationError as e:
+            return jsonify({"error": f"Invalid request: {e}"}), 400
+        except Exception as e:
+            logger.error(f"Error in {tool.operation_id}: {e}")
+            return jsonify({"error": str(e)}), 500
+        finally:
+            inflight_requests.add(-1)
+    view.__doc__ = tool.summary
+    return view
+
+
+for _tool in TOOL_REGISTRY:
+    app.add_url_rule(_tool.path, endpoint=_tool.operation_id,
+                     view_func=make_tool_view(_tool), methods=["POST"])
+
+# Readiness
+class ReadinessChecker:
+    """Periodic cluster and bridge checks whose last result is served by /readyz"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._state = {"status": "starting", "checks": {}}
+        self._checked_at = None
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="readiness", daemon=True)
+            self._thread.start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Readiness check failed: {e}")
+            time.sleep(self.interval)
+
+    def run_once(self):
+        checks = {
+            "binaries": _check_binaries(),
+            "contexts": _check_contexts(),
+            "saturation": _check_saturation(),
+        }
+        # Commands run against the current context; other contexts are informational
+        current = checks["contexts"].get(_current_context(), {})
+        ready = (
+            all(checks["binaries"].values())
+            and current.get("ready", False)
+            and not checks["saturation"]["saturated"]
+        )
+        with self._lock:
+            self._state = {"status": "ready" if ready else "not ready", "checks": checks}
+            self._checked_at = time.time()
+
+    def snapshot(self):
+        """Last result; stale results and an unfinished warm-up count as not ready"""
+        with self._lock:
+            state = dict(self._state)
+            checked_at = self._checked_at
+        if checked_at is not None:
+            state["ageSeconds"] = round(time.time() - checked_at, 1)
+            if state["ageSeconds"] > 3 * self.interval:
+                state["status"] = "stale"
+        state["startup"] = warmer.progress()
+        if state["status"] == "ready" and not warmer.done.is_set():
+            state["status"] = "warming"
+        return state
+
+
+def _check_binaries():
+    return {binary: shutil.which(binary) is not None for binary in ("kubectl", "helm")}
+
+
+def _kube_contexts():
+    return [c["name"] for c in KUBECONFIG.get("contexts", [])]
+
+
+def _current_context():
+    return KUBECONFIG.get("current-context")
+
+
+def _check_contexts():
+    """API /readyz and version discovery for each kubeconfig context"""
+    contexts = _kube_contexts()
+    if not contexts:
+        return {"<kubeconfig>": {"ready": False, "error": f"No contexts loaded from {KUBECONFIG_PATH}"}}
+
+    results = {}
+    for context in contexts:
+        base = ["kubectl", "--context", context, f"--request-timeout={READY_CHECK_TIMEOUT}s"]
+        try:
+            readyz = subprocess.run(base + ["get", "--raw", "/readyz"],
+                                    capture_output=True, text=True, timeout=READY_CHECK_TIMEOUT + 1)
+            version = subprocess.run(base + ["version", "-o", "json"],
+                                     capture_output=True, text=True, timeout=READY_CHECK_TIMEOUT + 1)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            results[context] = {"ready": False, "error": str(e)}
+            continue
+
+        entry = {"ready": readyz.returncode == 0 and readyz.stdout.strip() == "ok"}
+        if readyz.returncode != 0:
+            entry["error"] = truncate(readyz.stderr.strip(), 200)
+        try:
+            entry["serverVersion"] = json.loads(version.stdout)["serverVersion"]["gitVersion"]
+        except (ValueError, KeyError):
+            entry["ready"] = False
+            entry.setdefault("error", truncate(version.stderr.strip(), 200))
+        results[context] = entry
+    return results
+
+
+def _check_saturation():
+    inflight = inflight_requests.value()
+    return {
+        "inflight": inflight,
+        "maxInflight": MAX_INFLIGHT,
+        "logQueue": LOG_QUEUE.qsize(),
+        "saturated": inflight >= MAX_INFLIGHT or LOG_QUEUE.qsize() >= LOG_QUEUE_SATURATED,
+    }
+
 
-# Additional operations
-@app.route("/exec_pod", methods=["POST"])
-def exec_pod():
-    """Execute command in pod via MCP server"""
+readiness = ReadinessChecker(READY_CHECK_INTERVAL)
+
+
+@app.route("/livez", methods=["GET"])
+def liveness_check():
+    """Liveness: the process is serving requests"""
+    return jsonify({"status": "ok"})
+
+@app.route("/readyz", methods=["GET"])
+def readiness_check():
+    """Readiness: result of the last background cluster check"""
+    state = readiness.snapshot()
+    return jsonify(state), 200 if state["status"] == "ready" else 503
+
+# Startup phase
+class StartupWarmer:
+    """Runs warm-up tasks in parallel once at startup and tracks their progress"""
+
+    def __init__(self, workers, timeout):
+        self.workers = workers
+        self.timeout = timeout
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._tasks = {}
+        self._started_at = None
+        self._elapsed = None
+
+    def start(self, tasks):
+        """Run {name: callable} in a background thread"""
+        with self._lock:
+            self._tasks = {name: "pending" for name in tasks}
+            self._started_at = time.monotonic()
+        threading.Thread(target=self._run_all, args=(tasks,), name="warmup", daemon=True).start()
+
+    def _run_all(self, tasks):
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="warmup")
+        futures = [pool.submit(self._run, name, task) for name, task in tasks.items()]
+        concurrent.futures.wait(futures, timeout=self.timeout)
+        # Stragglers keep running but no longer hold up readiness
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        with self._lock:
+            for name, status in self._tasks.items():
+                if status in ("pending", "running"):
+                    self._tasks[name] = "timed out"
+            self._elapsed = round(time.monotonic() - self._started_at, 2)
+            summary = dict(self._tasks)
+        self.done.set()
+        # From here on only refetched data is served
+        resource_cache.serve_fallback = False
+        logger.info("startup warm-up finished", extra={"fields": {"elapsed_s": self._elapsed, "tasks": summary}})
+        save_snapshot()
+
+    def _run(self, name, task):
+        with self._lock:
+            self._tasks[name] = "running"
+        try:
+            task()
+            status = "ok"
+        except Exception as e:
+            status = f"failed: {truncate(str(e), 200)}"
+        with self._lock:
+            self._tasks[name] = status
+
+    def progress(self):
+        with self._lock:
+            progress = {"phase": "done" if self.done.is_set() else "warming", "tasks": dict(self._tasks)}
+            if self._elapsed is not None:
+                progress["elapsedSeconds"] = self._elapsed
+            elif self._started_at is not None:
+                progress["elapsedSeconds"] = round(time.monotonic() - self._started_at, 2)
+        return progress
+
+
+def _run_checked(cmd, timeout):
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"exit code {result.returncode}")
+
+
+def warm_tasks():
+    """Warm-up tasks: API discovery per context, helm repo indexes and configured cache lists"""
+    tasks = {}
+    for context in _kube_contexts():
+        tasks[f"discovery:{context}"] = lambda context=context: _run_checked(
+            ["kubectl", "--context", context, "api-resources", "-o", "name"], WARM_TIMEOUT)
+    if WARM_HELM_REPOS and shutil.which("helm"):
+        tasks["helm-repos"] = lambda: _run_checked(["helm", "repo", "update"], WARM_TIMEOUT)
+    for spec in filter(None, (s.strip() for s in WARM_RESOURCES.split(","))):
+        resource, _, namespace = spec.partition(":")
+        tasks[f"cache:{spec}"] = lambda resource=resource, namespace=namespace: resource_cache.prefetch(
+            resource, namespace or None)
+    return tasks
+
+
+def restore_snapshot():
+    """Load recent snapshot lists as a fallback served while warm-up refetches them.
+
+    Nothing is written to the cache backend, so a shared backend keeps the
+    newer lists other replicas fetched, and restored data keeps its age.
+    """
+    if not SNAPSHOT_PATH:
+        return
     try:
-        data = request.get_json()
-        logger.info(f"exec_pod request: {data}")
-        result = call_mcp_tool_via_sse("exec_in_pod", data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in exec_pod: {e}")
-        return jsonify({"error": str(e)}), 500
+        with open(SNAPSHOT_PATH) as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache snapshot: {e}")
+        return
+
+    now = time.time()
+    for key, entry in snapshot.get("entries", {}).items():
+        if isinstance(entry, dict) and now - entry.get("savedAt", 0) <= SNAPSHOT_MAX_AGE:
+            resource_cache.fallback[key] = (entry["savedAt"], entry.get("items", []))
+    resource_cache.serve_fallback = bool(resource_cache.fallback)
+    logger.info(f"Restored {len(resource_cache.fallback)} cache lists from snapshot as warm-up fallback")
+
+
+def save_snapshot():
+    """Persist cached lists for the next start.
 
-@app.route("/port_forward", methods=["POST"])
-def port_forward():
-    """Execute port forward via MCP server"""
+    Lists fetched since startup are saved as new; snapshot lists that were
+    never refetched keep their original savedAt until they pass the max age.
+    """
+    if not SNAPSHOT_PATH:
+        return
     try:
-        data = request.get_json()
-        logger.info(f"port_forward request: {data}")
-        result = call_mcp_tool_via_sse("port_forward", data)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error in port_forward: {e}")
-        return jsonify({"error": str(e)}), 500
+        fresh = cache_backend.dump("list:")
+        if not fresh:
+            # Keep the previous snapshot rather than overwrite it with nothing
+            return
+        now = time.time()
+        entries = {
+            key: {"savedAt": saved_at, "items": items}
+            for key, (saved_at, items) in resource_cache.fallback.items()
+            if now - saved_at <= SNAPSHOT_MAX_AGE
+        }
+        entries.update({key: {"savedAt": now, "items": items} for key, items in fresh.items()})
+        tmp_path = f"{SNAPSHOT_PATH}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"entries": entries}, f, separators=(",", ":"))
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Failed to save cache snapshot: {e}")
+
+
+warmer = StartupWarmer(WARM_WORKERS, WARM_TIMEOUT)
+
+
+def startup():
+    """Load config and restore state synchronously, then warm up and check readiness in the background"""
+    load_kubeconfig()
+    if BRIDGE_STATE_DIR:
+        os.makedirs(BRIDGE_STATE_DIR, exist_ok=True)
+        restore_snapshot()
+        atexit.register(save_snapshot)
+        # docker stop sends SIGTERM; exit normally so the snapshot is saved
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    warmer.start(warm_tasks())
+    resource_cache.start_refresher()
+    result_store.start_sweeper()
+    readiness.start()
+
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=9000, debug=True)
\ No newline at end of file
+    startup()
+    # The reloader would import this module in a second process and duplicate the background work
+    app.run(host="0.0.0.0", port=9000, debug=True, use_reloader=False)
\ No newline at end of file
@@ -8,6 +8,7 @@ BASE_URL="http://localhost:9000"
 echo ""
 echo "1. Testing Health Check..."
 curl -s "$BASE_URL/health" | jq .
+curl -s "$BASE_URL/readyz" | jq .
 
 echo ""
 echo "2. Testing kubectl_get (pods)..."
@@ -21,7 +22,7 @@ echo "3. Testing kubectl_describe (deployment)..."
 curl -s "$BASE_URL/kubectl_describe" \
   -X POST \
   -H "Content-Type: application/json" \
-  -d '{"resourceType":"deployment","name":"hello-mcp","namespace":"default"}' | jq '.metadata.name'
+  -d '{"resourceType":"deployment","name":"hello-mcp","namespace":"default"}' | jq '{kind, name, summary}'
 
 echo ""
 echo "4. Testing kubectl_logs..."
@@ -99,11 +100,19 @@ else
   echo "No pods available for exec test"
 fi
 
+echo ""
+echo "10. Testing cluster_summary..."
+curl -s "$BASE_URL/cluster_summary" \
+  -X POST \
+  -H "Content-Type: application/json" \
+  -d '{"top":5}' | jq .
+
 echo ""
 echo "✅ All method tests completed!"
 echo ""
 echo "📊 Summary of tested methods:"
 echo "   ✅ /health - Health check"
+echo "   ✅ /readyz - Readiness check"
 echo "   ✅ /kubectl_get - List resources"
 echo "   ✅ /kubectl_describe - Describe resources"
 echo "   ✅ /kubectl_apply - Apply manifests"
@@ -113,5 +122,6 @@ echo "   ✅ /kubectl_scale - Scale resources"
 echo "   ✅ /helm_install - Install Helm charts"
 echo "   ✅ /helm_uninstall - Uninstall Helm releases"
 echo "   ✅ /exec_pod - Execute commands in pods"
+echo "   ✅ /cluster_summary - Aggregated cluster health"
 echo "   ⚠️  /port_forward - Port forwarding (long-running)"
 echo "   ⚠️  /helm_upgrade - Helm upgrade (needs existing release)"
\ No newline at end of file